@@ -1,63 +1,140 @@
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # figures are only written to PNG
 import matplotlib.pyplot as plt
 import seaborn as sns
+import os
 from pathlib import Path
 from datetime import datetime
-import json
+
+from load_and_explore import load_data
 
 # Set up paths
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_PATH = PROJECT_ROOT / "data" / "case_loads.json"
 OUTPUT_PATH = PROJECT_ROOT / "output"
 VIZ_PATH = PROJECT_ROOT / "visualizations"
+CACHE_PATH = PROJECT_ROOT / "data" / "case_loads.parquet"
+STREET_CACHE_PATH = OUTPUT_PATH / "_cache_street_agg.parquet"
+LOADER_SOURCES = [Path(__file__), Path(__file__).with_name("load_and_explore.py")]
+
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+MONTH_ORDER = ['January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December']
+# Offense Time as strptime('%H:%M:%S') accepts it, capturing the hour (one or two digits)
+TIME_PATTERN = r'^([01]?\d|2[0-3]):[0-5]?\d:(?:[0-5]?\d|6[01])$'
+CATEGORICAL_COLUMNS = ['Offense Street Name', 'Offense Case Type', 'Agency', 'Case Closed', 'Race',
+                       'Defendant Gender', 'Offense Charge Description']
+BAR = '█' * 100  # sliced to a percentage width for text bar charts
 
 # Create directories
 OUTPUT_PATH.mkdir(exist_ok=True)
 VIZ_PATH.mkdir(exist_ok=True)
 
-# Set visualization style
-sns.set_style("whitegrid")
-plt.rcParams['figure.figsize'] = (14, 8)
-
 
-def load_clean_data():
-    """Load and clean the court case data"""
-    with open(DATA_PATH, 'r', encoding='utf-8') as f:
-        raw_data = json.load(f)
+def _cache_is_fresh(cache):
+    """Check that a cache file is newer than the source data and the loader modules"""
+    if not cache.exists():
+        return False
+    cache_mtime = cache.stat().st_mtime
+    return all(cache_mtime > source.stat().st_mtime for source in [DATA_PATH, *LOADER_SOURCES])
 
-    case_records = raw_data['data']
-    column_names = [col['name'] for col in raw_data['meta']['view']['columns']]
-    df = pd.DataFrame(case_records, columns=column_names)
 
-    # Data cleaning
-    df['Offense Date'] = pd.to_datetime(df['Offense Date'])
-    df['Year'] = df['Offense Date'].dt.year
-    df['Month'] = df['Offense Date'].dt.month
-    df['Month Name'] = df['Offense Date'].dt.strftime('%B')
-    df['Day of Week'] = df['Offense Date'].dt.day_name()
-    df['Weekday'] = df['Offense Date'].dt.weekday
-    df['Day'] = df['Offense Date'].dt.day
+def _read_cache(cache):
+    """Read a fresh Parquet snapshot, or None when it is missing, stale or unreadable"""
+    if cache is None or not _cache_is_fresh(cache):
+        return None
+    try:
+        return pd.read_parquet(cache)
+    except (ImportError, OSError, ValueError) as e:
+        print(f"! Rebuilding unreadable Parquet cache {cache.name}: {e}")
+        return None
 
-    # Parse time properly
-    df['Hour'] = pd.to_datetime(df['Offense Time'], format='%H:%M:%S', errors='coerce').dt.hour
 
-    # Create useful flags
-    df['Has_Demographics'] = ~(df['Race'].isnull() | df['Defendant Gender'].isnull())
-    df['Is_School_Zone'] = df['School Zone'] == True
-    df['Is_Active'] = df['Case Closed'] == 'ACT'
-    df['Is_Parking'] = df['Offense Case Type'] == 'PK'
-    df['Is_Traffic'] = df['Offense Case Type'] == 'TR'
+def _write_cache(frame, cache):
+    """Snapshot a frame to Parquet via a temp file so readers never see a partial write"""
+    tmp = cache.with_name(f".{cache.name}.{os.getpid()}.tmp")
+    try:
+        frame.to_parquet(tmp, compression='zstd')
+        os.replace(tmp, cache)
+    except (ImportError, OSError, TypeError, ValueError, NotImplementedError) as e:
+        tmp.unlink(missing_ok=True)
+        print(f"! Skipping Parquet cache: {e}")
+
+
+def _category_mask(series, value):
+    """Boolean array marking rows of a categorical series equal to value"""
+    code = series.cat.categories.get_indexer([value])[0]
+    if code == -1:
+        return np.zeros(len(series), dtype=bool)
+    return series.cat.codes.to_numpy() == code
+
+
+def load_clean_data(cache=CACHE_PATH):
+    """Load and clean the court case data, reusing the Parquet snapshot when current"""
+    # Back text columns with Arrow strings (the default from pandas 3.0 onwards),
+    # scoped to the load so importers keep their own pandas options
+    with pd.option_context('future.infer_string', True):
+        return _load_clean_data(cache)
+
+
+def _load_clean_data(cache):
+    """Parse, clean and snapshot the case frame unless a current snapshot exists"""
+    cached = _read_cache(cache)
+    if cached is not None:
+        return cached
+
+    # Parsing and frame construction are shared with the exploration script
+    df = load_data(verbose=False)
+
+    # Data cleaning: calendar fields come from integer day/month offsets since the epoch
+    df['Offense Date'] = pd.to_datetime(df['Offense Date'], format='ISO8601')
+    days = df['Offense Date'].to_numpy(dtype='datetime64[D]')
+    months = days.astype('datetime64[M]')
+    missing = np.isnat(days)
+    month_index = months.astype(np.int64) % 12
+    weekday = (days.astype(np.int64) + 3) % 7  # 1970-01-01 was a Thursday
+    date_parts = {
+        'Year': months.astype(np.int64) // 12 + 1970,
+        'Month': month_index + 1,
+        'Weekday': weekday,
+        'Day': (days - months).astype(np.int64) + 1
+    }
+    for col, values in date_parts.items():
+        df[col] = np.where(missing, np.nan, values) if missing.any() else values.astype(np.int32)
+    df['Month Name'] = pd.Categorical.from_codes(np.where(missing, -1, month_index),
+                                                 dtype=pd.CategoricalDtype(MONTH_ORDER, ordered=True))
+    df['Day of Week'] = pd.Categorical.from_codes(np.where(missing, -1, weekday),
+                                                  dtype=pd.CategoricalDtype(DAY_ORDER, ordered=True))
+
+    # Hour comes from a regex match instead of a datetime parse; malformed or out-of-range
+    # times (e.g. 24:00:00 or -1:00:00) stay missing, as with the strptime format
+    df['Hour'] = pd.to_numeric(df['Offense Time'].str.extract(TIME_PATTERN, expand=False)).astype('Int8')
+
+    # Store repetitive text columns as categoricals so counts and groupbys work on codes
+    for col in CATEGORICAL_COLUMNS:
+        df[col] = df[col].astype('category')
+
+    # Create useful flags straight from the category codes (-1 marks a missing value)
+    df['Has_Demographics'] = ((df['Race'].cat.codes.to_numpy() != -1) &
+                              (df['Defendant Gender'].cat.codes.to_numpy() != -1))
+    df['Is_School_Zone'] = df['School Zone'].to_numpy() == True
+    df['Is_Active'] = _category_mask(df['Case Closed'], 'ACT')
+    df['Is_Parking'] = _category_mask(df['Offense Case Type'], 'PK')
+    df['Is_Traffic'] = _category_mask(df['Offense Case Type'], 'TR')
+
+    # Snapshot the cleaned frame; Parquet keeps the derived dtypes intact
+    if cache is not None:
+        _write_cache(df, cache)
 
     return df
 
 
-def get_mode_safe(x):
-    """Safely get mode, handling empty series"""
-    if len(x) == 0:
-        return None
-    mode_vals = x.mode()
-    return mode_vals.iloc[0] if len(mode_vals) > 0 else None
+def grouped_mode(df, by, col):
+    """Most frequent col value per by group; ties resolve to the first category like Series.mode"""
+    counts = df.groupby([by, col], observed=True).size()
+    return counts.groupby(level=0, observed=True).idxmax().map(lambda key: key[1]).rename(col)
 
 
 def temporal_analysis(df):
@@ -69,30 +146,27 @@ def temporal_analysis(df):
     # Daily pattern
     print("\n📅 CASES BY DAY OF WEEK")
     print("-" * 80)
-    day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    daily_cases = df['Day of Week'].value_counts().reindex(day_order)
+    daily_cases = df['Day of Week'].value_counts(sort=False)
+    lines = []
     for day, count in daily_cases.items():
         pct = (count / len(df)) * 100
-        bar = '█' * int(pct)
-        print(f"{day:10s}: {count:5,} ({pct:5.1f}%) {bar}")
+        lines.append(f"{day:10s}: {count:5,} ({pct:5.1f}%) {BAR[:int(pct)]}")
+    print("\n".join(lines))
 
     # Hourly pattern (for cases with time data)
     print("\n🕐 PEAK ENFORCEMENT HOURS (Top 10)")
     print("-" * 80)
-    hourly_cases = df['Hour'].value_counts().sort_index().head(10)
-    for hour, count in hourly_cases.items():
-        if pd.notna(hour):
-            print(f"{int(hour):02d}:00 - {count:,} cases")
+    hourly_cases = integer_counts(df['Hour']).head(10)
+    print("\n".join(f"{hour:02d}:00 - {count:,} cases" for hour, count in hourly_cases.items()))
 
     # Day of month pattern
     print("\n📆 CASES BY DAY OF MONTH")
     print("-" * 80)
-    daily_dist = df['Day'].value_counts().sort_index()
-    for day, count in daily_dist.head(10).items():
-        print(f"Day {day:2d}: {count:,} cases")
+    daily_dist = integer_counts(df['Day'])
+    print("\n".join(f"Day {day:2d}: {count:,} cases" for day, count in daily_dist.head(10).items()))
 
     # Create visualizations
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    fig, axes = plt.subplots(2, 2, figsize=(16, 12), layout='constrained')
 
     # 1. Cases by Day of Week
     daily_cases.plot(kind='bar', ax=axes[0, 0], color='steelblue')
@@ -108,8 +182,14 @@ def temporal_analysis(df):
     axes[0, 1].set_ylabel('Number of Cases')
     axes[0, 1].grid(True, alpha=0.3)
 
-    # 3. Case Type Distribution
-    df['Offense Case Type'].value_counts().plot(kind='pie', ax=axes[1, 0], autopct='%1.1f%%')
+    # 3. Case Type Distribution (six largest types, the rest folded into Other)
+    type_counts = df['Offense Case Type'].value_counts()
+    pie_counts = type_counts[type_counts > 0].head(6)
+    pie_counts.index = pie_counts.index.astype(str)
+    other_cases = type_counts.sum() - pie_counts.sum()
+    if other_cases > 0:
+        pie_counts['Other'] = other_cases
+    pie_counts.plot(kind='pie', ax=axes[1, 0], autopct='%1.1f%%')
     axes[1, 0].set_title('Case Type Distribution', fontsize=14, fontweight='bold')
     axes[1, 0].set_ylabel('')
 
@@ -121,34 +201,84 @@ def temporal_analysis(df):
     axes[1, 1].set_ylabel('Number of Cases')
     axes[1, 1].tick_params(axis='x', rotation=0)
 
-    plt.tight_layout()
-    plt.savefig(VIZ_PATH / 'temporal_analysis.png', dpi=300, bbox_inches='tight')
+    plt.savefig(VIZ_PATH / 'temporal_analysis.png', dpi=150, pil_kwargs={'compress_level': 1})
     print(f"\n✓ Visualization saved: temporal_analysis.png")
     plt.close()
 
 
-def geographic_analysis(df):
-    """Analyze geographic patterns"""
+def top_counts(series, k):
+    """Largest k value counts of a categorical series, tallied on its integer codes"""
+    codes = series.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+    # A stable sort over the few hundred categories keeps ties in category order
+    order = np.argsort(-counts, kind='stable')
+    top = order[counts[order] > 0][:k]
+    return pd.Series(counts[top], index=series.cat.categories[top], name='count')
+
+
+def integer_counts(series):
+    """Counts of a small non-negative integer series in ascending value order"""
+    counts = np.bincount(series.dropna().to_numpy(dtype=np.int64))
+    present = np.flatnonzero(counts)
+    return pd.Series(counts[present], index=present, name='count')
+
+
+def street_aggregates(df):
+    """Per-street totals shared by the location, heat map and geocoding reports"""
+    street_stats = df.groupby('Offense Street Name', observed=True, sort=False).agg(
+        Total_Cases=('sid', 'count'),
+        Active_Cases=('Is_Active', 'sum'),
+        Parking_Cases=('Is_Parking', 'sum'),
+        Traffic_Cases=('Is_Traffic', 'sum')
+    )
+
+    # Rank case types within each street; the stable sort keeps tied types in category order
+    type_counts = df.groupby(['Offense Street Name', 'Offense Case Type'], observed=True).size()
+    top_types = type_counts.sort_values(ascending=False, kind='stable').groupby(level=0, observed=True).head(3)
+    top_types = top_types.reset_index(level=1)['Offense Case Type'].astype(str).groupby(level=0, observed=True)
+    street_stats['Primary_Case_Type'] = top_types.first()
+    street_stats['Top_Case_Types'] = top_types.agg(', '.join)
+    street_stats['Primary_Agency'] = grouped_mode(df, 'Offense Street Name', 'Agency')
+
+    return street_stats
+
+
+def cached_street_aggregates(df, cache=STREET_CACHE_PATH):
+    """Per-street totals from the comprehensive report's snapshot when it matches df
+
+    The snapshot is trusted only while it is current and its totals add up to
+    the street-tagged cases in df; otherwise the totals are regrouped from df.
+    """
+    street_stats = _read_cache(cache)
+    street_cases = df.loc[df['Offense Street Name'].notna(), 'sid'].count()
+    if street_stats is not None and street_stats['Total_Cases'].sum() == street_cases:
+        return street_stats
+    return street_aggregates(df)
+
+
+def geographic_analysis(df, street_cache=None):
+    """Analyze geographic patterns, optionally snapshotting the per-street totals for reuse"""
     print("\n" + "=" * 80)
     print("📍 GEOGRAPHIC PATTERN ANALYSIS")
     print("=" * 80)
 
+    # Save detailed location data - FIXED
+    street_stats = street_aggregates(df)
+    if street_cache is not None:
+        _write_cache(street_stats, street_cache)
+    location_report = street_stats[['Total_Cases', 'Primary_Case_Type', 'Active_Cases', 'Primary_Agency']].rename(
+        columns={'Primary_Case_Type': 'Offense Case Type', 'Primary_Agency': 'Agency'})
+    location_report = location_report.sort_values('Total_Cases', ascending=False)
+
     print("\n🗺️ TOP 20 ENFORCEMENT LOCATIONS")
     print("-" * 80)
-    top_streets = df['Offense Street Name'].value_counts().head(20)
+    top_streets = location_report['Total_Cases'].head(20)
+    lines = []
     for i, (street, count) in enumerate(top_streets.items(), 1):
         pct = (count / len(df)) * 100
-        print(f"{i:2d}. {street:50s}: {count:5,} ({pct:4.1f}%)")
-
-    # Save detailed location data - FIXED
-    location_report = df.groupby('Offense Street Name').agg({
-        'sid': 'count',
-        'Offense Case Type': get_mode_safe,
-        'Is_Active': 'sum',
-        'Agency': get_mode_safe
-    }).rename(columns={'sid': 'Total_Cases', 'Is_Active': 'Active_Cases'})
+        lines.append(f"{i:2d}. {street:50s}: {count:5,} ({pct:4.1f}%)")
+    print("\n".join(lines))
 
-    location_report = location_report.sort_values('Total_Cases', ascending=False)
     location_report.to_csv(OUTPUT_PATH / 'location_hotspots.csv')
     print(f"\n✓ Location analysis saved: location_hotspots.csv")
 
@@ -161,28 +291,35 @@ def charge_analysis(df):
 
     print("\n🚨 TOP 15 VIOLATION TYPES")
     print("-" * 80)
-    top_charges = df['Offense Charge Description'].value_counts().head(15)
+    top_charges = top_counts(df['Offense Charge Description'], 15)
+    lines = []
     for i, (charge, count) in enumerate(top_charges.items(), 1):
         pct = (count / len(df)) * 100
-        print(f"{i:2d}. {charge:60s}: {count:5,} ({pct:4.1f}%)")
+        lines.append(f"{i:2d}. {charge:60s}: {count:5,} ({pct:4.1f}%)")
+    print("\n".join(lines))
+
+    # One grouping feeds both the per-type breakdown and the saved report
+    charge_report = df.groupby(['Offense Case Type', 'Offense Charge Description'], observed=True, sort=False).agg({
+        'sid': 'count',
+        'Is_Active': 'sum'
+    }).rename(columns={'sid': 'Total_Cases', 'Is_Active': 'Active_Cases'})
+    charge_report = charge_report.sort_values('Total_Cases', ascending=False)
 
     # Charge by case type
     print("\n📊 CHARGE DISTRIBUTION BY CASE TYPE")
     print("-" * 80)
-    for case_type in df['Offense Case Type'].unique():
-        if pd.notna(case_type):
-            type_df = df[df['Offense Case Type'] == case_type]
-            print(f"\n{case_type} Cases: {len(type_df):,}")
-            top_3 = type_df['Offense Charge Description'].value_counts().head(3)
-            for charge, count in top_3.items():
-                print(f"  - {charge}: {count:,}")
+    type_totals = df.groupby('Offense Case Type', observed=True, sort=False).size()
+    top_3 = charge_report['Total_Cases'].groupby(level=0, observed=True).head(3)
+    top_3_by_type = {case_type: charges.droplevel(0)
+                     for case_type, charges in top_3.groupby(level=0, observed=True)}
+    lines = []
+    for case_type, type_count in type_totals.items():
+        lines.append(f"\n{case_type} Cases: {type_count:,}")
+        for charge, count in top_3_by_type.get(case_type, pd.Series()).items():
+            lines.append(f"  - {charge}: {count:,}")
+    print("\n".join(lines))
 
     # Save charge analysis
-    charge_report = df.groupby(['Offense Case Type', 'Offense Charge Description']).agg({
-        'sid': 'count',
-        'Is_Active': 'sum'
-    }).rename(columns={'sid': 'Total_Cases', 'Is_Active': 'Active_Cases'})
-    charge_report = charge_report.sort_values('Total_Cases', ascending=False)
     charge_report.to_csv(OUTPUT_PATH / 'charge_analysis.csv')
     print(f"\n✓ Charge analysis saved: charge_analysis.csv")
 
@@ -193,25 +330,23 @@ def demographic_analysis(df):
     print("👥 DEMOGRAPHIC ANALYSIS (Limited Data)")
     print("=" * 80)
 
-    # Filter to cases with demographic data
-    demo_df = df[df['Has_Demographics']].copy()
+    # Filter to cases with demographic data, keeping only the columns read below
+    demo_df = df.loc[df['Has_Demographics'].to_numpy(), ['Race', 'Defendant Gender', 'Offense Case Type']]
 
     print(f"\nCases with demographic data: {len(demo_df):,} ({len(demo_df) / len(df) * 100:.1f}%)")
 
     if len(demo_df) > 0:
         print("\n🎭 RACE DISTRIBUTION (Available Data Only)")
         print("-" * 80)
-        race_dist = demo_df['Race'].value_counts()
-        for race, count in race_dist.items():
-            pct = (count / len(demo_df)) * 100
-            print(f"{race:20s}: {count:5,} ({pct:5.1f}%)")
+        race_dist = demo_df['Race'].value_counts().loc[lambda s: s > 0]
+        print("\n".join(f"{race:20s}: {count:5,} ({count / len(demo_df) * 100:5.1f}%)"
+                        for race, count in race_dist.items()))
 
         print("\n⚥ GENDER DISTRIBUTION (Available Data Only)")
         print("-" * 80)
-        gender_dist = demo_df['Defendant Gender'].value_counts()
-        for gender, count in gender_dist.items():
-            pct = (count / len(demo_df)) * 100
-            print(f"{gender:10s}: {count:5,} ({pct:5.1f}%)")
+        gender_dist = demo_df['Defendant Gender'].value_counts().loc[lambda s: s > 0]
+        print("\n".join(f"{gender:10s}: {count:5,} ({count / len(demo_df) * 100:5.1f}%)"
+                        for gender, count in gender_dist.items()))
 
         # Demographics by case type
         print("\n📈 DEMOGRAPHICS BY CASE TYPE")
@@ -232,14 +367,14 @@ def agency_performance_analysis(df):
     print("🏛️ AGENCY ENFORCEMENT ANALYSIS")
     print("=" * 80)
 
-    agency_stats = df.groupby('Agency').agg({
-        'sid': 'count',
-        'Is_Active': ['sum', 'mean'],
-        'Is_School_Zone': 'sum',
-        'Offense Case Type': get_mode_safe
-    }).round(3)
+    agency_stats = df.groupby('Agency', observed=True, sort=False).agg(
+        Total_Cases=('sid', 'count'),
+        Active_Cases=('Is_Active', 'sum'),
+        School_Zone_Cases=('Is_School_Zone', 'sum')
+    )
 
-    agency_stats.columns = ['Total_Cases', 'Active_Cases', 'Active_Rate', 'School_Zone_Cases', 'Primary_Case_Type']
+    agency_stats.insert(2, 'Active_Rate', (agency_stats['Active_Cases'] / agency_stats['Total_Cases']).round(3))
+    agency_stats['Primary_Case_Type'] = grouped_mode(df, 'Agency', 'Offense Case Type')
     agency_stats = agency_stats.sort_values('Total_Cases', ascending=False)
 
     print("\nAGENCY PERFORMANCE METRICS")
@@ -258,29 +393,38 @@ def policy_recommendations(df):
 
     recommendations = []
 
+    # Headline counts, each a single reduction over the underlying arrays
+    total_cases = len(df)
+    race_missing = df['Race'].isna().to_numpy().sum()
+    active_cases = df['Is_Active'].to_numpy().sum()
+    parking_cases = df['Is_Parking'].to_numpy().sum()
+    school_zone_cases = df['Is_School_Zone'].to_numpy().sum()
+    weekend_cases = (df['Day of Week'].cat.codes.to_numpy() >= DAY_ORDER.index('Saturday')).sum()
+
     # Recommendation 1: Data Collection
-    if df['Race'].isnull().mean() > 0.5:
+    race_missing_rate = race_missing / total_cases
+    if race_missing_rate > 0.5:
         recommendations.append({
             'Priority': 'HIGH',
             'Category': 'Data Quality',
-            'Issue': f'{df["Race"].isnull().mean() * 100:.1f}% missing demographic data',
+            'Issue': f'{race_missing_rate * 100:.1f}% missing demographic data',
             'Recommendation': 'Mandate demographic data collection for all case types to enable equity analysis',
             'Impact': 'Enable bias detection and ensure equitable enforcement'
         })
 
     # Recommendation 2: Active Case Backlog
-    active_rate = df['Is_Active'].mean()
+    active_rate = active_cases / total_cases
     if active_rate > 0.6:
         recommendations.append({
             'Priority': 'HIGH',
             'Category': 'Case Management',
             'Issue': f'{active_rate * 100:.1f}% of cases remain active',
             'Recommendation': 'Review case processing procedures and staffing levels',
-            'Impact': f'Resolve {df["Is_Active"].sum():,} pending cases faster'
+            'Impact': f'Resolve {active_cases:,} pending cases faster'
         })
 
     # Recommendation 3: Parking Enforcement
-    parking_pct = df['Is_Parking'].mean()
+    parking_pct = parking_cases / total_cases
     if parking_pct > 0.8:
         recommendations.append({
             'Priority': 'MEDIUM',
@@ -291,18 +435,17 @@ def policy_recommendations(df):
         })
 
     # Recommendation 4: School Zone Safety
-    if df['Is_School_Zone'].sum() > 0:
+    if school_zone_cases > 0:
         recommendations.append({
             'Priority': 'MEDIUM',
             'Category': 'Public Safety',
-            'Issue': f'{df["Is_School_Zone"].sum():,} school zone violations',
+            'Issue': f'{school_zone_cases:,} school zone violations',
             'Recommendation': 'Enhance school zone enforcement and education campaigns',
             'Impact': 'Improve child safety near schools'
         })
 
     # Recommendation 5: Weekend Enforcement
-    weekend_cases = df[df['Day of Week'].isin(['Saturday', 'Sunday'])].shape[0]
-    weekend_pct = weekend_cases / len(df)
+    weekend_pct = weekend_cases / total_cases
     if weekend_pct < 0.2:
         recommendations.append({
             'Priority': 'LOW',
@@ -314,11 +457,11 @@ def policy_recommendations(df):
 
     print("\n📋 RECOMMENDED ACTIONS")
     print("-" * 80)
-    for i, rec in enumerate(recommendations, 1):
-        print(f"\n{i}. [{rec['Priority']}] {rec['Category']}")
-        print(f"   Issue: {rec['Issue']}")
-        print(f"   Action: {rec['Recommendation']}")
-        print(f"   Impact: {rec['Impact']}")
+    print("\n".join(f"\n{i}. [{rec['Priority']}] {rec['Category']}\n"
+                    f"   Issue: {rec['Issue']}\n"
+                    f"   Action: {rec['Recommendation']}\n"
+                    f"   Impact: {rec['Impact']}"
+                    for i, rec in enumerate(recommendations, 1)))
 
     # Save recommendations
     rec_df = pd.DataFrame(recommendations)
@@ -327,6 +470,10 @@ def policy_recommendations(df):
 
 
 if __name__ == "__main__":
+    # Set visualization style here so importing the shared helpers leaves plotting defaults alone
+    sns.set_style("whitegrid")
+    plt.rcParams['figure.figsize'] = (14, 8)
+
     print("=" * 80)
     print("COMPREHENSIVE POLICY ANALYSIS - MUNICIPAL COURT CASES")
     print("=" * 80)
@@ -334,7 +481,7 @@ if __name__ == "__main__":
     df = load_clean_data()
 
     temporal_analysis(df)
-    geographic_analysis(df)
+    geographic_analysis(df, street_cache=STREET_CACHE_PATH)
     charge_analysis(df)
     demographic_analysis(df)
     agency_performance_analysis(df)
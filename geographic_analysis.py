@@ -1,36 +1,57 @@
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # figures are only written to PNG
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
-import json
+import re
 from collections import Counter
 
+from comprehensive_analysis import cached_street_aggregates, grouped_mode, load_clean_data
+
 # Set up paths
 PROJECT_ROOT = Path(__file__).parent.parent
-DATA_PATH = PROJECT_ROOT / "data" / "case_loads.json"
 OUTPUT_PATH = PROJECT_ROOT / "output"
 VIZ_PATH = PROJECT_ROOT / "visualizations"
 
 OUTPUT_PATH.mkdir(exist_ok=True)
 VIZ_PATH.mkdir(exist_ok=True)
 
+# Street name after an optional house number, with surrounding whitespace trimmed
+STREET_BASE_PATTERN = re.compile(r'(?:\d+\s+)?(?=[A-Z\s])\s*([A-Z\s]*[A-Z]|)')
 
-def load_clean_data():
-    """Load and clean the court case data"""
-    with open(DATA_PATH, 'r', encoding='utf-8') as f:
-        raw_data = json.load(f)
+# Right-closed case count buckets per location; intensity merges the two middle ones
+CONCENTRATION_BINS = np.array([0, 10, 25, 50, 100, 500])
+CONCENTRATION_LABELS = ['1-10', '11-25', '26-50', '51-100', '100+']
+INTENSITY_LABELS = ['Low', 'Medium', 'High', 'Critical']
+INTENSITY_BY_CONCENTRATION = np.array([0, 1, 1, 2, 3])
 
-    case_records = raw_data['data']
-    column_names = [col['name'] for col in raw_data['meta']['view']['columns']]
-    df = pd.DataFrame(case_records, columns=column_names)
 
-    df['Offense Date'] = pd.to_datetime(df['Offense Date'])
-    df['Is_Parking'] = df['Offense Case Type'] == 'PK'
-    df['Is_Traffic'] = df['Offense Case Type'] == 'TR'
-    df['Is_Active'] = df['Case Closed'] == 'ACT'
+def label_streets(streets, groups, default, missing=None):
+    """Label each street with the first group whose keywords appear in its name
 
-    return df
+    Keywords are matched once per distinct street category and the result is
+    spread back to the rows through the category codes.
+    """
+    names = streets.cat.categories.astype(str).str.upper()
+    conditions = [names.str.contains('|'.join(map(re.escape, keywords)), regex=True)
+                  for keywords in groups.values()]
+    labels = list(groups) + [default]
+    label_by_street = np.select(conditions, np.arange(len(groups)), default=len(groups))
+
+    # Missing streets have code -1, which indexes the trailing missing/default entry
+    if missing is not None:
+        labels.append(missing)
+    label_by_street = np.append(label_by_street, len(labels) - 1)
+    return pd.Categorical.from_codes(label_by_street[streets.cat.codes.to_numpy()], categories=labels)
+
+
+def concentration_codes(counts):
+    """Concentration bucket of each count, or -1 outside the bins (same intervals as pd.cut)"""
+    codes = np.searchsorted(CONCENTRATION_BINS, counts, side='left') - 1
+    codes[(codes < 0) | (codes >= len(CONCENTRATION_LABELS))] = -1
+    return codes
 
 
 def extract_street_patterns(df):
@@ -43,8 +64,7 @@ def extract_street_patterns(df):
     df['Street_Clean'] = df['Offense Street Name'].str.upper().str.strip()
 
     # Extract street base names (remove numbers)
-    df['Street_Base'] = df['Street_Clean'].str.extract(r'(\d+\s+)?([A-Z\s]+)', expand=False)[1]
-    df['Street_Base'] = df['Street_Base'].str.strip()
+    df['Street_Base'] = df['Street_Clean'].str.extract(STREET_BASE_PATTERN, expand=False)
 
     # Group by major corridors
     print("\n🛣️  TOP CORRIDORS (Aggregated by street name)")
@@ -53,7 +73,6 @@ def extract_street_patterns(df):
     corridor_counts = df['Street_Base'].value_counts().head(20)
     for i, (corridor, count) in enumerate(corridor_counts.items(), 1):
         pct = (count / len(df)) * 100
-        total_on_street = len(df[df['Street_Base'] == corridor])
         print(f"{i:2d}. {corridor:40s}: {count:5,} locations ({pct:4.1f}%)")
 
     return df
@@ -78,30 +97,21 @@ def analyze_major_corridors(df):
     }
 
     # Categorize each case by corridor
-    def categorize_corridor(street):
-        if pd.isna(street):
-            return 'Other'
-        street = str(street).upper()
-        for corridor_name, keywords in corridors.items():
-            if any(keyword in street for keyword in keywords):
-                return corridor_name
-        return 'Other'
-
-    df['Corridor'] = df['Offense Street Name'].apply(categorize_corridor)
+    df['Corridor'] = label_streets(df['Offense Street Name'], corridors, default='Other')
 
     # Analyze by corridor
-    corridor_analysis = df.groupby('Corridor').agg({
+    corridor_analysis = df.groupby('Corridor', observed=True, sort=False).agg({
         'sid': 'count',
         'Is_Parking': 'sum',
         'Is_Traffic': 'sum',
-        'Is_Active': 'sum',
-        'Offense Case Type': lambda x: x.mode()[0] if len(x) > 0 else None
+        'Is_Active': 'sum'
     }).rename(columns={
         'sid': 'Total_Cases',
         'Is_Parking': 'Parking_Cases',
         'Is_Traffic': 'Traffic_Cases',
         'Is_Active': 'Active_Cases'
     })
+    corridor_analysis['Offense Case Type'] = grouped_mode(df, 'Corridor', 'Offense Case Type')
 
     corridor_analysis['Active_Rate'] = (corridor_analysis['Active_Cases'] /
                                         corridor_analysis['Total_Cases'] * 100).round(1)
@@ -124,32 +134,26 @@ def analyze_major_corridors(df):
     return df, corridor_analysis
 
 
-def create_heatmap_data(df):
+def create_heatmap_data(street_stats):
     """Create data for heat mapping"""
     print("\n" + "=" * 80)
     print("🔥 GENERATING HEAT MAP DATA")
     print("=" * 80)
 
-    # Group by exact location
-    location_heatmap = df.groupby('Offense Street Name').agg({
-        'sid': 'count',
-        'Is_Parking': 'sum',
-        'Is_Traffic': 'sum',
-        'Offense Case Type': lambda x: ', '.join(x.value_counts().head(3).index.tolist())
-    }).rename(columns={
-        'sid': 'Case_Count',
-        'Is_Parking': 'Parking_Count',
-        'Is_Traffic': 'Traffic_Count',
-        'Offense Case Type': 'Top_Case_Types'
+    # Exact-location totals come from the shared per-street aggregation
+    location_heatmap = street_stats[['Total_Cases', 'Parking_Cases', 'Traffic_Cases', 'Top_Case_Types']].rename(columns={
+        'Total_Cases': 'Case_Count',
+        'Parking_Cases': 'Parking_Count',
+        'Traffic_Cases': 'Traffic_Count'
     })
 
     location_heatmap = location_heatmap.sort_values('Case_Count', ascending=False)
 
-    # Categorize intensity
-    location_heatmap['Intensity'] = pd.cut(
-        location_heatmap['Case_Count'],
-        bins=[0, 10, 50, 100, 500],
-        labels=['Low', 'Medium', 'High', 'Critical']
+    # Categorize intensity from the concentration buckets
+    codes = concentration_codes(location_heatmap['Case_Count'].to_numpy())
+    location_heatmap['Intensity'] = pd.Categorical.from_codes(
+        np.where(codes >= 0, INTENSITY_BY_CONCENTRATION[codes], -1),
+        dtype=pd.CategoricalDtype(INTENSITY_LABELS, ordered=True)
     )
 
     print("\nENFORCEMENT INTENSITY DISTRIBUTION")
@@ -179,47 +183,31 @@ def analyze_district_patterns(df):
     print("🏙️  DISTRICT/AREA ANALYSIS")
     print("=" * 80)
 
-    # Identify areas by keywords in street names
-    def categorize_area(street):
-        if pd.isna(street):
-            return 'Unknown'
-        street = str(street).upper()
-
-        # Downtown
-        if any(x in street for x in ['CONGRESS', 'COLORADO', 'BRAZOS', 'LAVACA', 'SAN JACINTO', 'TRINITY']):
-            return 'Downtown'
-        # University area
-        elif any(x in street for x in ['DEAN KEETON', 'GUADALUPE', 'NUECES', 'RIO GRANDE']):
-            return 'University/Campus'
-        # Airport
-        elif any(x in street for x in ['PRESIDENTIAL', 'BERGSTROM', 'AIRPORT']):
-            return 'Airport Area'
-        # East Austin
-        elif any(x in street for x in ['E 7TH', 'E 6TH', 'E 5TH', 'CESAR CHAVEZ', 'HOLLY']):
-            return 'East Austin'
-        # South Austin
-        elif any(x in street for x in ['S CONGRESS', 'S LAMAR', 'S 1ST', 'OLTORF']):
-            return 'South Austin'
-        # North Austin
-        elif any(x in street for x in ['N LAMAR', 'BURNET', 'ANDERSON']):
-            return 'North Austin'
-        # West Austin
-        elif any(x in street for x in ['MOPAC', 'WEST GATE']):
-            return 'West Austin'
-        else:
-            return 'Other'
-
-    df['Area'] = df['Offense Street Name'].apply(categorize_area)
-
-    area_analysis = df.groupby('Area').agg({
-        'sid': 'count',
-        'Is_Parking': ['sum', 'mean'],
-        'Is_Traffic': ['sum', 'mean'],
-        'Is_Active': 'mean'
-    }).round(3)
+    # Identify areas by keywords in street names (first match wins)
+    areas = {
+        'Downtown': ['CONGRESS', 'COLORADO', 'BRAZOS', 'LAVACA', 'SAN JACINTO', 'TRINITY'],
+        'University/Campus': ['DEAN KEETON', 'GUADALUPE', 'NUECES', 'RIO GRANDE'],
+        'Airport Area': ['PRESIDENTIAL', 'BERGSTROM', 'AIRPORT'],
+        'East Austin': ['E 7TH', 'E 6TH', 'E 5TH', 'CESAR CHAVEZ', 'HOLLY'],
+        'South Austin': ['S CONGRESS', 'S LAMAR', 'S 1ST', 'OLTORF'],
+        'North Austin': ['N LAMAR', 'BURNET', 'ANDERSON'],
+        'West Austin': ['MOPAC', 'WEST GATE']
+    }
 
-    area_analysis.columns = ['Total_Cases', 'Parking_Count', 'Parking_Rate',
-                             'Traffic_Count', 'Traffic_Rate', 'Active_Rate']
+    df['Area'] = label_streets(df['Offense Street Name'], areas, default='Other', missing='Unknown')
+
+    area_analysis = df.groupby('Area', observed=True, sort=False).agg(
+        Total_Cases=('sid', 'count'),
+        Parking_Count=('Is_Parking', 'sum'),
+        Traffic_Count=('Is_Traffic', 'sum'),
+        Active_Count=('Is_Active', 'sum')
+    )
+
+    # Rates are derived from the counts rather than a second mean reduction
+    totals = area_analysis['Total_Cases']
+    area_analysis.insert(2, 'Parking_Rate', (area_analysis['Parking_Count'] / totals).round(3))
+    area_analysis['Traffic_Rate'] = (area_analysis['Traffic_Count'] / totals).round(3)
+    area_analysis['Active_Rate'] = (area_analysis.pop('Active_Count') / totals).round(3)
     area_analysis = area_analysis.sort_values('Total_Cases', ascending=False)
 
     print("\nAREA ENFORCEMENT SUMMARY")
@@ -233,13 +221,13 @@ def analyze_district_patterns(df):
     return df, area_analysis
 
 
-def create_geographic_visualizations(df, corridor_analysis, area_analysis):
+def create_geographic_visualizations(corridor_analysis, area_analysis, location_heatmap):
     """Create geographic visualizations"""
     print("\n" + "=" * 80)
     print("📊 CREATING GEOGRAPHIC VISUALIZATIONS")
     print("=" * 80)
 
-    fig, axes = plt.subplots(2, 2, figsize=(18, 12))
+    fig, axes = plt.subplots(2, 2, figsize=(18, 12), layout='constrained')
 
     # 1. Top Corridors
     ax1 = axes[0, 0]
@@ -278,11 +266,9 @@ def create_geographic_visualizations(df, corridor_analysis, area_analysis):
 
     # 4. Location Concentration
     ax4 = axes[1, 1]
-    location_counts = df['Offense Street Name'].value_counts()
-    concentration_bins = [0, 10, 25, 50, 100, 500]
-    concentration_labels = ['1-10', '11-25', '26-50', '51-100', '100+']
-    location_distribution = pd.cut(location_counts, bins=concentration_bins,
-                                   labels=concentration_labels).value_counts().sort_index()
+    codes = concentration_codes(location_heatmap['Case_Count'].to_numpy())
+    location_distribution = pd.Series(np.bincount(codes[codes >= 0], minlength=len(CONCENTRATION_LABELS)),
+                                      index=CONCENTRATION_LABELS)
 
     ax4.bar(range(len(location_distribution)), location_distribution.values, color='darkgreen')
     ax4.set_xticks(range(len(location_distribution)))
@@ -294,29 +280,28 @@ def create_geographic_visualizations(df, corridor_analysis, area_analysis):
         ax4.text(i, v + 5, str(v), ha='center', fontweight='bold')
 
     plt.suptitle('GEOGRAPHIC ENFORCEMENT ANALYSIS - OCTOBER 2025',
-                 fontsize=14, fontweight='bold', y=0.98)
-    plt.tight_layout()
-    plt.savefig(VIZ_PATH / 'geographic_analysis.png', dpi=300, bbox_inches='tight')
+                 fontsize=14, fontweight='bold')
+    plt.savefig(VIZ_PATH / 'geographic_analysis.png', dpi=150, pil_kwargs={'compress_level': 1})
     print(f"✓ Geographic visualization saved: geographic_analysis.png")
     plt.close()
 
 
-def generate_geocoding_template(df):
+def generate_geocoding_template(street_stats):
     """Generate template for geocoding"""
     print("\n" + "=" * 80)
     print("🗺️  GENERATING GEOCODING TEMPLATE")
     print("=" * 80)
 
     # Get unique locations with counts
-    location_summary = df.groupby('Offense Street Name').agg({
-        'sid': 'count',
-        'Offense Case Type': lambda x: x.mode()[0] if len(x) > 0 else None
-    }).rename(columns={'sid': 'Case_Count'})
+    location_summary = street_stats[['Total_Cases', 'Primary_Case_Type']].rename(columns={
+        'Total_Cases': 'Case_Count',
+        'Primary_Case_Type': 'Offense Case Type'
+    })
 
     location_summary = location_summary.sort_values('Case_Count', ascending=False)
 
     # Add city and state for geocoding
-    location_summary['Full_Address'] = location_summary.index + ', Austin, TX'
+    location_summary['Full_Address'] = location_summary.index.astype(str) + ', Austin, TX'
     location_summary['Latitude'] = ''
     location_summary['Longitude'] = ''
     location_summary['Geocoded'] = False
@@ -347,17 +332,21 @@ if __name__ == "__main__":
     # Major corridor analysis
     df, corridor_analysis = analyze_major_corridors(df)
 
+    # Per-street totals shared by the heat map and geocoding template
+    # (read back from the comprehensive analysis snapshot when it is current)
+    street_stats = cached_street_aggregates(df)
+
     # Heat map data
-    location_heatmap = create_heatmap_data(df)
+    location_heatmap = create_heatmap_data(street_stats)
 
     # District/area analysis
     df, area_analysis = analyze_district_patterns(df)
 
     # Create visualizations
-    create_geographic_visualizations(df, corridor_analysis, area_analysis)
+    create_geographic_visualizations(corridor_analysis, area_analysis, location_heatmap)
 
     # Generate geocoding template
-    generate_geocoding_template(df)
+    generate_geocoding_template(street_stats)
 
     print("\n" + "=" * 80)
     print("✅ GEOGRAPHIC ANALYSIS COMPLETE")
@@ -1,5 +1,8 @@
 import pandas as pd
-import json
+import orjson
+import pyarrow as pa
+import pyarrow.csv as pv
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Set up paths
@@ -8,12 +11,16 @@ DATA_PATH = PROJECT_ROOT / "data" / "case_loads.json"
 OUTPUT_PATH = PROJECT_ROOT / "output"
 
 
-def load_data():
-    """Load and properly parse the nested JSON data with column names"""
-    with open(DATA_PATH, 'r', encoding='utf-8') as f:
-        raw_data = json.load(f)
+def load_data(verbose=True):
+    """Load and properly parse the nested JSON data with column names
 
-    print(f"Raw data type: {type(raw_data)}")
+    verbose=False silences the structure diagnostics when another loader builds on this one.
+    """
+    log = print if verbose else lambda *args: None
+
+    raw_data = orjson.loads(DATA_PATH.read_bytes())
+
+    log(f"Raw data type: {type(raw_data)}")
 
     # Handle different JSON structures
     if isinstance(raw_data, list):
@@ -38,87 +45,150 @@ def load_data():
         case_records = raw_data
         column_names = None
 
-    print(f"Case records type: {type(case_records)}")
-    print(f"Number of records: {len(case_records) if case_records else 0}")
+    log(f"Case records type: {type(case_records)}")
+    log(f"Number of records: {len(case_records) if case_records else 0}")
 
-    # Convert to DataFrame
-    df = pd.DataFrame(case_records)
+    # Convert to DataFrame, transposing the row lists once when metadata names every field.
+    # zip(*rows) truncates to the shortest row and a dict merges repeated names, so ragged
+    # payloads and duplicate column names take the positional constructor.
+    if column_names and case_records and len(set(column_names)) == len(column_names) and \
+            all(isinstance(row, list) and len(row) == len(column_names) for row in case_records):
+        columns = dict(zip(column_names, zip(*case_records)))
+        df = pd.DataFrame(columns, columns=column_names, copy=False)
+    else:
+        df = pd.DataFrame(case_records)
 
     # Rename columns if we found metadata
     if column_names and len(column_names) == len(df.columns):
         df.columns = column_names
-        print(f"✓ Applied {len(column_names)} column names from metadata")
+        log(f"✓ Applied {len(column_names)} column names from metadata")
     else:
-        print(f"! Using default column indices (0-{len(df.columns) - 1})")
+        log(f"! Using default column indices (0-{len(df.columns) - 1})")
 
     return df
 
 
 def data_quality_check(df):
     """Analyze data quality"""
-    print("\n" + "=" * 60)
-    print("DATA QUALITY ASSESSMENT")
-    print("=" * 60)
+    lines = []
+    lines.append("\n" + "=" * 60)
+    lines.append("DATA QUALITY ASSESSMENT")
+    lines.append("=" * 60)
 
-    for col in df.columns:
-        null_count = df[col].isnull().sum()
+    # Null and distinct counts for every column in one pass each
+    null_counts = df.isnull().sum()
+    unique_counts = df.nunique()
+
+    for col, null_count, unique_count in zip(df.columns, null_counts, unique_counts):
         null_pct = (null_count / len(df)) * 100
-        unique_count = df[col].nunique()
 
-        print(f"\n{col}:")
-        print(f"  Missing: {null_count:,} ({null_pct:.1f}%)")
-        print(f"  Unique values: {unique_count:,}")
+        lines.append(f"\n{col}:")
+        lines.append(f"  Missing: {null_count:,} ({null_pct:.1f}%)")
+        lines.append(f"  Unique values: {unique_count:,}")
 
         # Show sample values for categorical fields
         if null_pct < 50 and unique_count <= 20:
-            print(f"  Top values:")
+            lines.append(f"  Top values:")
             for val, count in df[col].value_counts().head(5).items():
-                print(f"    {val}: {count:,}")
+                lines.append(f"    {val}: {count:,}")
+
+    print("\n".join(lines))
 
 
 def initial_exploration(df):
     """Perform initial data exploration"""
-    print("\n" + "=" * 60)
-    print("MUNICIPAL COURT CASES - DATASET OVERVIEW")
-    print("=" * 60)
-    print(f"\nTotal Case Records: {len(df):,}")
-    print(f"Total Fields: {len(df.columns)}")
-
-    print(f"\nColumn Names:")
+    lines = []
+    lines.append("\n" + "=" * 60)
+    lines.append("MUNICIPAL COURT CASES - DATASET OVERVIEW")
+    lines.append("=" * 60)
+    lines.append(f"\nTotal Case Records: {len(df):,}")
+    lines.append(f"Total Fields: {len(df.columns)}")
+
+    lines.append(f"\nColumn Names:")
     for i, col in enumerate(df.columns, 1):
-        print(f"  {i:2d}. {col}")
+        lines.append(f"  {i:2d}. {col}")
 
-    print(f"\n" + "=" * 60)
-    print("SAMPLE CASE RECORD")
-    print("=" * 60)
+    lines.append(f"\n" + "=" * 60)
+    lines.append("SAMPLE CASE RECORD")
+    lines.append("=" * 60)
     for col in df.columns:
         value = df[col].iloc[0]
-        print(f"{col:35s}: {value}")
+        lines.append(f"{col:35s}: {value}")
+
+    print("\n".join(lines))
 
     return df
 
 
+def _write_arrow_csv(table, path):
+    """Write an Arrow table as unquoted CSV so the text matches pandas' minimal quoting
+
+    Arrow's 'needed' style quotes every string, so rows are written with quoting
+    off and the header is written here; a name or value containing a delimiter,
+    quote or newline raises ValueError instead.
+    """
+    if any(ch in name for name in table.column_names for ch in ',"\r\n'):
+        raise ValueError("column names need quoting")
+
+    write_options = pv.WriteOptions(include_header=False, batch_size=16384, quoting_style='none')
+    with pa.OSFile(str(path), 'wb') as sink:
+        sink.write((','.join(table.column_names) + '\n').encode('utf-8'))
+        pv.write_csv(table, sink, write_options=write_options)
+
+
+def save_case_csvs(df):
+    """Write the full and 500-row sample case CSVs with Arrow's native CSV writer
+
+    The text differs from DataFrame.to_csv in two ways: booleans are written as
+    true/false (pandas: True/False) and whole-valued floats drop the trailing .0,
+    so integer columns with missing values read 1 rather than 1.0.
+    """
+    full_path = OUTPUT_PATH / "cases_full.csv"
+    sample_path = OUTPUT_PATH / "cases_sample_500.csv"
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+
+        # The sample is a zero-copy slice of the same table
+        _write_arrow_csv(table, full_path)
+        _write_arrow_csv(table.slice(0, 500), sample_path)
+    except (TypeError, ValueError, NotImplementedError) as e:
+        # Columns Arrow cannot convert or render as CSV (mixed objects, structs) and
+        # text that needs quoting are left to pandas' formatter
+        print(f"! Writing CSVs with pandas: {e}")
+        df.to_csv(full_path, index=False)
+        df.head(500).to_csv(sample_path, index=False)
+
+
+def write_column_info(df):
+    """Write the per-column type, non-null and unique summary to column_info.txt"""
+    # One frame-wide pass per statistic; the loop below only formats
+    non_null = df.count()
+    uniques = df.nunique()
+
+    with open(OUTPUT_PATH / "column_info.txt", 'w') as f:
+        f.write("COLUMN INFORMATION\n")
+        f.write("=" * 60 + "\n\n")
+        for i, (col, dtype, count, unique) in enumerate(zip(df.columns, df.dtypes, non_null, uniques), 1):
+            f.write(f"{i:2d}. {col}\n"
+                    f"    Type: {dtype}\n"
+                    f"    Non-null: {count:,} / {len(df):,}\n"
+                    f"    Unique: {unique:,}\n\n")
+
+
 if __name__ == "__main__":
     print("Loading Municipal Court Case data...\n")
     df = load_data()
     df = initial_exploration(df)
     data_quality_check(df)
 
-    # Save outputs
+    # Save outputs; the CSV and column info writers are independent and
+    # Arrow's CSV writer releases the GIL, so they run side by side
     OUTPUT_PATH.mkdir(exist_ok=True)
-    df.to_csv(OUTPUT_PATH / "cases_full.csv", index=False)
-    df.head(500).to_csv(OUTPUT_PATH / "cases_sample_500.csv", index=False)
-
-    # Save column info
-    with open(OUTPUT_PATH / "column_info.txt", 'w') as f:
-        f.write("COLUMN INFORMATION\n")
-        f.write("=" * 60 + "\n\n")
-        for i, col in enumerate(df.columns, 1):
-            f.write(f"{i:2d}. {col}\n")
-            f.write(f"    Type: {df[col].dtype}\n")
-            f.write(f"    Non-null: {df[col].count():,} / {len(df):,}\n")
-            f.write(f"    Unique: {df[col].nunique():,}\n")
-            f.write("\n")
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        writes = [pool.submit(save_case_csvs, df), pool.submit(write_column_info, df)]
+    for write in writes:
+        write.result()
 
     print(f"\n{'=' * 60}")
     print(f"✓ Output files saved to: {OUTPUT_PATH}")
@@ -1,13 +1,13 @@
-import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
 from datetime import datetime
 
+from comprehensive_analysis import load_clean_data
+
 # Set up paths
 PROJECT_ROOT = Path(__file__).parent.parent
-DATA_PATH = PROJECT_ROOT / "data" / "case_loads.json"
 OUTPUT_PATH = PROJECT_ROOT / "output"
 VIZ_PATH = PROJECT_ROOT / "visualizations"
 
@@ -20,110 +20,111 @@ sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 6)
 
 
-def load_clean_data():
-    """Load and clean the court case data"""
-    import json
-
-    with open(DATA_PATH, 'r', encoding='utf-8') as f:
-        raw_data = json.load(f)
-
-    case_records = raw_data['data']
-    column_names = [col['name'] for col in raw_data['meta']['view']['columns']]
-    df = pd.DataFrame(case_records, columns=column_names)
-
-    # Data cleaning
-    df['Offense Date'] = pd.to_datetime(df['Offense Date'])
-    df['Year'] = df['Offense Date'].dt.year
-    df['Month'] = df['Offense Date'].dt.month
-    df['Month Name'] = df['Offense Date'].dt.strftime('%B')
-    df['Day of Week'] = df['Offense Date'].dt.day_name()
-    df['Hour'] = pd.to_datetime(df['Offense Time'], format='%H:%M:%S', errors='coerce').dt.hour
-
-    # Create useful flags
-    df['Has_Demographics'] = ~(df['Race'].isnull() | df['Defendant Gender'].isnull())
-    df['Is_School_Zone'] = df['School Zone'] == True
-    df['Is_Active'] = df['Case Closed'] == 'ACT'
-
-    return df
-
-
 def policy_analysis_overview(df):
-    """Generate executive summary for policy makers"""
-    print("=" * 80)
-    print("MUNICIPAL COURT POLICY ANALYSIS - FISCAL YEAR 2026")
-    print("=" * 80)
-
-    print("\n📊 EXECUTIVE SUMMARY")
-    print("-" * 80)
-    print(f"Total Cases Filed: {len(df):,}")
-    print(
-        f"Date Range: {df['Offense Date'].min().strftime('%B %d, %Y')} to {df['Offense Date'].max().strftime('%B %d, %Y')}")
-    print(f"Active Cases: {df['Is_Active'].sum():,} ({df['Is_Active'].mean() * 100:.1f}%)")
-    print(f"Closed Cases: {(~df['Is_Active']).sum():,} ({(~df['Is_Active']).mean() * 100:.1f}%)")
-
-    print("\n🎯 CASE TYPE DISTRIBUTION")
-    print("-" * 80)
+    """Generate executive summary for policy makers
+
+    Returns the frame and the summary figures that save_policy_report reuses.
+    """
+    # Scan each flag column once; the rates below are derived from these counts
+    total_cases = len(df)
+    active_cases = df['Is_Active'].sum()
+    closed_cases = total_cases - active_cases
+    race_missing = df['Race'].isnull().sum()
+    gender_missing = df['Defendant Gender'].isnull().sum()
+    race_missing_pct = race_missing / total_cases * 100
+    first_date, last_date = df['Offense Date'].min(), df['Offense Date'].max()
+
+    # Collect the summary and print it in one write
+    lines = []
+    lines.append("=" * 80)
+    lines.append("MUNICIPAL COURT POLICY ANALYSIS - FISCAL YEAR 2026")
+    lines.append("=" * 80)
+
+    lines.append("\n📊 EXECUTIVE SUMMARY")
+    lines.append("-" * 80)
+    lines.append(f"Total Cases Filed: {total_cases:,}")
+    lines.append(
+        f"Date Range: {first_date.strftime('%B %d, %Y')} to {last_date.strftime('%B %d, %Y')}")
+    lines.append(f"Active Cases: {active_cases:,} ({active_cases / total_cases * 100:.1f}%)")
+    lines.append(f"Closed Cases: {closed_cases:,} ({closed_cases / total_cases * 100:.1f}%)")
+
+    lines.append("\n🎯 CASE TYPE DISTRIBUTION")
+    lines.append("-" * 80)
     case_type_dist = df['Offense Case Type'].value_counts()
     for case_type, count in case_type_dist.items():
-        pct = (count / len(df)) * 100
-        print(f"{case_type:4s}: {count:6,} cases ({pct:5.1f}%)")
+        pct = (count / total_cases) * 100
+        lines.append(f"{case_type:4s}: {count:6,} cases ({pct:5.1f}%)")
 
-    print("\n🏢 ENFORCEMENT AGENCIES")
-    print("-" * 80)
+    lines.append("\n🏢 ENFORCEMENT AGENCIES")
+    lines.append("-" * 80)
     agency_dist = df['Agency'].value_counts()
     for agency, count in agency_dist.head(5).items():
-        pct = (count / len(df)) * 100
-        print(f"{agency:50s}: {count:6,} ({pct:5.1f}%)")
-
-    print("\n⚠️ DATA QUALITY CONCERNS")
-    print("-" * 80)
-    print(f"Missing Race Data: {df['Race'].isnull().sum():,} cases ({df['Race'].isnull().mean() * 100:.1f}%)")
-    print(
-        f"Missing Gender Data: {df['Defendant Gender'].isnull().sum():,} cases ({df['Defendant Gender'].isnull().mean() * 100:.1f}%)")
-    print(f"  → Policy Impact: Cannot assess equity/bias in {df['Race'].isnull().mean() * 100:.1f}% of cases")
-
-    print("\n🎓 SCHOOL ZONE VIOLATIONS")
-    print("-" * 80)
+        pct = (count / total_cases) * 100
+        lines.append(f"{agency:50s}: {count:6,} ({pct:5.1f}%)")
+
+    lines.append("\n⚠️ DATA QUALITY CONCERNS")
+    lines.append("-" * 80)
+    lines.append(f"Missing Race Data: {race_missing:,} cases ({race_missing_pct:.1f}%)")
+    lines.append(f"Missing Gender Data: {gender_missing:,} cases ({gender_missing / total_cases * 100:.1f}%)")
+    lines.append(f"  → Policy Impact: Cannot assess equity/bias in {race_missing_pct:.1f}% of cases")
+
+    lines.append("\n🎓 SCHOOL ZONE VIOLATIONS")
+    lines.append("-" * 80)
     school_zone_cases = df['Is_School_Zone'].sum()
-    print(f"School Zone Cases: {school_zone_cases:,} ({df['Is_School_Zone'].mean() * 100:.1f}%)")
+    lines.append(f"School Zone Cases: {school_zone_cases:,} ({school_zone_cases / total_cases * 100:.1f}%)")
+
+    print("\n".join(lines))
 
-    return df
+    summary = {
+        'total_cases': total_cases,
+        'date_range': (first_date, last_date),
+        'race_missing_pct': race_missing_pct,
+        'case_type_dist': case_type_dist,
+        'active_pct': active_cases / total_cases * 100
+    }
+    return df, summary
 
 
-def save_policy_report(df):
-    """Save comprehensive policy report"""
+def save_policy_report(summary):
+    """Save comprehensive policy report from the overview's summary figures"""
     report_path = OUTPUT_PATH / "policy_analysis_report.txt"
+    total_cases = summary['total_cases']
+    first_date, last_date = summary['date_range']
+
+    # Assemble the report in memory and write it in one call
+    lines = []
+    lines.append("=" * 80 + "\n")
+    lines.append("MUNICIPAL COURT POLICY ANALYSIS REPORT\n")
+    lines.append("FISCAL YEAR 2026\n")
+    lines.append("=" * 80 + "\n\n")
+
+    lines.append(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    lines.append(f"Total Cases Analyzed: {total_cases:,}\n")
+    lines.append(f"Date Range: {first_date} to {last_date}\n\n")
+
+    lines.append("POLICY FINDINGS AND RECOMMENDATIONS:\n")
+    lines.append("-" * 80 + "\n\n")
+
+    # Finding 1: Data Quality
+    lines.append("1. DATA COLLECTION GAPS\n")
+    lines.append(f"   - {summary['race_missing_pct']:.1f}% of cases missing demographic data\n")
+    lines.append("   - Recommendation: Mandate demographic data collection for equity analysis\n\n")
+
+    # Finding 2: Case Load by Type
+    lines.append("2. CASE TYPE DISTRIBUTION\n")
+    for case_type, count in summary['case_type_dist'].items():
+        lines.append(f"   - {case_type}: {count:,} cases ({count / total_cases * 100:.1f}%)\n")
+    lines.append("\n")
+
+    # Finding 3: Active vs Closed
+    active_rate = summary['active_pct']
+    lines.append(f"3. CASE RESOLUTION RATE\n")
+    lines.append(f"   - Active Cases: {active_rate:.1f}%\n")
+    lines.append(f"   - Closed Cases: {100 - active_rate:.1f}%\n")
+    lines.append(f"   - Recommendation: Review case processing efficiency\n\n")
 
     with open(report_path, 'w') as f:
-        f.write("=" * 80 + "\n")
-        f.write("MUNICIPAL COURT POLICY ANALYSIS REPORT\n")
-        f.write("FISCAL YEAR 2026\n")
-        f.write("=" * 80 + "\n\n")
-
-        f.write(f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Total Cases Analyzed: {len(df):,}\n")
-        f.write(f"Date Range: {df['Offense Date'].min()} to {df['Offense Date'].max()}\n\n")
-
-        f.write("POLICY FINDINGS AND RECOMMENDATIONS:\n")
-        f.write("-" * 80 + "\n\n")
-
-        # Finding 1: Data Quality
-        f.write("1. DATA COLLECTION GAPS\n")
-        f.write(f"   - {df['Race'].isnull().mean() * 100:.1f}% of cases missing demographic data\n")
-        f.write("   - Recommendation: Mandate demographic data collection for equity analysis\n\n")
-
-        # Finding 2: Case Load by Type
-        f.write("2. CASE TYPE DISTRIBUTION\n")
-        for case_type, count in df['Offense Case Type'].value_counts().items():
-            f.write(f"   - {case_type}: {count:,} cases ({count / len(df) * 100:.1f}%)\n")
-        f.write("\n")
-
-        # Finding 3: Active vs Closed
-        active_rate = df['Is_Active'].mean() * 100
-        f.write(f"3. CASE RESOLUTION RATE\n")
-        f.write(f"   - Active Cases: {active_rate:.1f}%\n")
-        f.write(f"   - Closed Cases: {100 - active_rate:.1f}%\n")
-        f.write(f"   - Recommendation: Review case processing efficiency\n\n")
+        f.write("".join(lines))
 
     print(f"\n✓ Policy report saved to: {report_path}")
 
@@ -132,8 +133,8 @@ if __name__ == "__main__":
     print("Loading and analyzing Municipal Court data...\n")
 
     df = load_clean_data()
-    df = policy_analysis_overview(df)
-    save_policy_report(df)
+    df, summary = policy_analysis_overview(df)
+    save_policy_report(summary)
 
     print("\n" + "=" * 80)
     print("✓ ANALYSIS COMPLETE")